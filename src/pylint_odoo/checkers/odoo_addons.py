@@ -104,6 +104,7 @@ import re
 import string
 import warnings
 from collections import Counter, defaultdict
+from functools import lru_cache
 
 from astroid import ClassDef, FunctionDef, NodeNG, nodes
 from pylint.checkers import BaseChecker, utils
@@ -387,6 +388,16 @@ PRINTF_PATTERN = re.compile(
 )
 
 
+@lru_cache(maxsize=256)
+def compile_version_format(manifest_version_format_parsed):
+    """Compile the parsed manifest version format regex
+
+    It is using lru_cache since the same pattern is rebuilt for every
+    manifest checked (and for every pylint run in the same process)
+    """
+    return re.compile(manifest_version_format_parsed)
+
+
 class OdooAddons(OdooBaseChecker, BaseChecker):
     _from_imports = None
     name = "odoolint"
@@ -1418,7 +1429,8 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         valid_odoo_versions = "|".join(map(re.escape, valid_odoo_versions))
         manifest_version_format = self.linter.config.manifest_version_format
         manifest_version_format_parsed = manifest_version_format.format(valid_odoo_versions=valid_odoo_versions)
-        return re.match(manifest_version_format_parsed, version_string), manifest_version_format_parsed
+        formatrgx = compile_version_format(manifest_version_format_parsed)
+        return formatrgx.match(version_string), manifest_version_format_parsed
 
     def join_node_args_kwargs(self, node):
         """Method to join args and keywords
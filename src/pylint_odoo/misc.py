@@ -7,6 +7,8 @@ from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlsplit
 
+from pylint.lint import PyLinter
+
 MANIFEST_DATA_KEYS = ["data", "demo", "demo_xml", "init_xml", "test", "update_xml"]
 
 README_FILES = ["README.rst", "README.md", "README.txt"]
@@ -51,20 +53,37 @@ def version_parse(version_str):
         return tuple()
 
 
-def get_plugin_msgs(pylint_run_res):
+def get_plugin_msgs(pylint_run_res=None):
     """Get all message of this pylint plugin.
     :param pylint_run_res: Object returned by pylint.run method.
+        If it is not given, a bare linter with the plugin loaded is used
+        instead, so no analysis run is needed at all.
     :return: List of strings with message name.
     """
+    if pylint_run_res is None:
+        return list(_get_plugin_msgs_cached())
+    return _get_plugin_msgs_from_linter(pylint_run_res.linter)
+
 
+def _get_plugin_msgs_from_linter(linter):
     all_plugin_msgs = []
-    for key, message in pylint_run_res.linter.msgs_store._messages_definitions.items():
-        checker_name = message.msgid
-        if checker_name == "odoolint":
+    for key, message in linter.msgs_store._messages_definitions.items():
+        if message.checker_name == "odoolint":
             all_plugin_msgs.append(key)
     return all_plugin_msgs
 
 
+@lru_cache(maxsize=1)
+def _get_plugin_msgs_cached():
+    """The plugin messages are a static property of the loaded checkers
+    so they are enumerated once from a bare linter and reused
+    """
+    linter = PyLinter()
+    linter.load_default_plugins()
+    linter.load_plugin_modules(["pylint_odoo"])
+    return tuple(_get_plugin_msgs_from_linter(linter))
+
+
 @contextmanager
 def chdir(directory):
     """Change the current directory similar to command 'cd directory'
@@ -0,0 +1,75 @@
+"""Persist astroid's AST cache for the test corpus to disk across runs.
+
+Astroid keeps the modules it builds in the in-memory ``AstroidManager``
+cache, which is thrown away with the process; every test session therefore
+re-parses the same unchanged files under ``testing/resources``. The
+session-scoped fixture below pre-populates the manager cache from a pickle
+on disk and re-pickles it on teardown, keyed by file mtime and astroid
+version so stale entries are never reused.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+
+import astroid
+import pytest
+
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), ".astroid_cache")
+_CACHE_FILE = os.path.join(_CACHE_DIR, "manager.pkl")
+_RESOURCES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "testing", "resources")
+
+
+def _walk(node):
+    yield node
+    for child in node.get_children():
+        yield from _walk(child)
+
+
+def _load_astroid_cache(manager):
+    try:
+        with open(_CACHE_FILE, "rb") as f_cache:
+            cached = pickle.load(f_cache)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return
+    if cached.get("astroid_version") != astroid.__version__:
+        return
+    for modname, (mtime_ns, blob) in cached.get("modules", {}).items():
+        try:
+            module = pickle.loads(blob)
+            if os.stat(module.file).st_mtime_ns != mtime_ns:
+                continue
+        except (OSError, AttributeError, pickle.UnpicklingError):
+            continue
+        # The inference tips were stripped before pickling (their closures
+        # are not picklable); transforms are idempotent so re-apply them.
+        manager.visit_transforms(module)
+        manager.astroid_cache.setdefault(modname, module)
+
+
+def _dump_astroid_cache(manager):
+    modules = {}
+    for modname, module in manager.astroid_cache.items():
+        path = getattr(module, "file", None)
+        if not path or not os.path.realpath(path).startswith(_RESOURCES_PATH + os.sep):
+            continue
+        for node in _walk(module):
+            if getattr(node, "_explicit_inference", None) is not None:
+                node._explicit_inference = None
+        try:
+            modules[modname] = (os.stat(path).st_mtime_ns, pickle.dumps(module))
+        except (OSError, pickle.PicklingError, AttributeError, TypeError, RecursionError):
+            continue
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    with open(_CACHE_FILE, "wb") as f_cache:
+        pickle.dump({"astroid_version": astroid.__version__, "modules": modules}, f_cache)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def astroid_disk_cache():
+    """Reuse the ASTs of the unchanged test corpus between test sessions"""
+    manager = astroid.MANAGER
+    _load_astroid_cache(manager)
+    yield
+    _dump_astroid_cache(manager)